@@ -791,7 +791,7 @@ LEFT JOIN aircraft a ON f.aircraft_reg = a.aircraft_reg
 LEFT JOIN airports origin ON f.origin_icao = origin.icao_code
 LEFT JOIN airports dest ON f.dest_icao = dest.icao_code
 WHERE f.status = 'Canceled'
-ORDER BY f.scheduled_dep DESC NULLS LAST
+ORDER BY f.scheduled_dep DESC  -- NULLs sort last under DESC in SQLite
 """
 
 result9 = run_query(
@@ -861,7 +861,12 @@ result11 = run_query(
 
 """#PHASE 4: STREAMLIT"""
 import streamlit as st
-import sqlite3
+import duckdb
+import hashlib
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -882,19 +887,222 @@ st.set_page_config(
 # 🗄️ DATABASE CONNECTION
 # ============================================================================
 
+# Aggregates over the static flights table, precomputed once per process
+# into the in-memory s catalog (the SQLite file is only ever read).
+MATERIALIZED_VIEWS = {
+    "mv_status_counts": """
+        SELECT status, COUNT(*) AS count
+        FROM s.flights
+        GROUP BY status
+    """,
+    "mv_flights_per_model": """
+        SELECT 
+            a.aircraft_model,
+            COUNT(f.flight_id) AS total_flights
+        FROM s.flights f
+        JOIN s.aircraft a ON f.aircraft_reg = a.aircraft_reg
+        GROUP BY a.aircraft_model
+    """,
+    "mv_status_by_airline": """
+        SELECT 
+            f.airline_name,
+            COUNT(*) FILTER (WHERE f.status = 'Arrived')     AS arrived,
+            COUNT(*) FILTER (WHERE f.status = 'Departed')    AS departed,
+            COUNT(*) FILTER (WHERE f.status = 'Unknown')     AS unknown,
+            COUNT(*) FILTER (WHERE f.status = 'Expected')    AS expected,
+            COUNT(*) FILTER (WHERE f.status = 'Approaching') AS approaching,
+            COUNT(*) FILTER (WHERE f.status = 'Canceled')    AS canceled,
+            COUNT(*) FILTER (WHERE f.status = 'Delayed')     AS delayed,
+            COUNT(*) AS total_flights
+        FROM s.flights f
+        GROUP BY f.airline_name
+    """,
+    "mv_delays_by_dest": """
+        SELECT 
+            ap.name AS airport_name,
+            ap.city,
+            ap.iata_code,
+            COUNT(f.flight_id) AS total_arrivals,
+            COUNT(*) FILTER (WHERE f.status = 'Delayed' OR f.delay_arr > 0) AS delayed_arrivals,
+            ROUND(
+                (COUNT(*) FILTER (WHERE f.status = 'Delayed' OR f.delay_arr > 0) * 100.0)
+                / COUNT(f.flight_id),
+                2
+            ) AS delay_percentage
+        FROM s.airports ap
+        JOIN s.flights f ON ap.icao_code = f.dest_icao
+        GROUP BY ap.icao_code, ap.name, ap.city, ap.iata_code
+        HAVING COUNT(f.flight_id) > 0
+    """,
+}
+
+SOURCE_TABLES = ['flights', 'aircraft', 'airports']
+
+@st.cache_resource
+def get_duckdb():
+    """DuckDB engine holding in-memory columnar copies of air_tracker.db"""
+    con = duckdb.connect()
+    con.execute("INSTALL sqlite; LOAD sqlite;")
+    con.execute("ATTACH 'air_tracker.db' AS src (TYPE sqlite, READ_ONLY)")
+    # Queries address the s catalog; loading it once keeps every page on
+    # DuckDB's vectorized scans instead of the row-at-a-time sqlite scanner
+    con.execute("ATTACH ':memory:' AS s")
+    for table in SOURCE_TABLES:
+        con.execute(f"CREATE TABLE s.{table} AS SELECT * FROM src.{table}")
+    con.execute("DETACH src")
+    for name, query in MATERIALIZED_VIEWS.items():
+        con.execute(f"CREATE TABLE s.{name} AS {query}")
+    return con
+
 @st.cache_resource
-def get_connection():
-    """Create database connection"""
-    return sqlite3.connect('air_tracker.db', check_same_thread=False)
+def get_data_version():
+    """Fingerprint of the mv_* definitions and the loaded source tables"""
+    cur = get_duckdb().cursor()
+    # Order-independent hash over every row, so a reload that rewrites
+    # values (even at the same row count) yields a new version
+    sources = [cur.execute(f"SELECT COUNT(*), SUM(hash(t)) FROM s.{table} t").fetchone()
+               for table in SOURCE_TABLES]
+    fingerprint = repr((sorted(MATERIALIZED_VIEWS.items()), sources))
+    return hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()
 
 def get_data(query, params=None):
     """Execute SQL query and return DataFrame"""
-    conn = get_connection()
-    if params:
-        df = pd.read_sql_query(query, conn, params=params)
-    else:
-        df = pd.read_sql_query(query, conn)
-    return df
+    cur = get_duckdb().cursor()
+    return cur.execute(query, list(params or [])).df()
+
+def get_row(query, params=None):
+    """Execute a single-row query and return it as a dict (no DataFrame)"""
+    cur = get_duckdb().cursor().execute(query, list(params or []))
+    cols = [d[0] for d in cur.description]
+    return dict(zip(cols, cur.fetchone()))
+
+CACHE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'air_tracker')
+CACHE_PREFIX = 'v-'
+
+@st.cache_resource
+def get_cache_dir():
+    """Parquet spill directory for the current data version (older ones removed)"""
+    name = CACHE_PREFIX + get_data_version()[:16]
+    if os.path.isdir(CACHE_ROOT):
+        # Only prune our own version directories, never unrelated files
+        for entry in os.scandir(CACHE_ROOT):
+            if entry.is_dir() and entry.name.startswith(CACHE_PREFIX) \
+                    and entry.name != name:
+                shutil.rmtree(entry.path, ignore_errors=True)
+    cache_dir = os.path.join(CACHE_ROOT, name)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def spill_query(con, cache_dir, query):
+    """Execute query on a new cursor, spilling the result to cache_dir as Parquet"""
+    path = os.path.join(cache_dir, hashlib.sha1(query.encode('utf-8')).hexdigest() + '.parquet')
+    cur = con.cursor()
+    if not os.path.exists(path):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        cur.execute(f"COPY ({query}) TO '{tmp_path}' (FORMAT parquet)")
+        os.replace(tmp_path, path)
+    return cur.execute("SELECT * FROM read_parquet(?)", [path]).df()
+
+@st.cache_data(ttl=3600)
+def cached_query(query):
+    """Execute a fixed, parameterless query (memoized, Parquet-backed)"""
+    return spill_query(get_duckdb(), get_cache_dir(), query)
+
+@st.cache_data(ttl=3600)
+def run_all_queries(queries):
+    """Prefetch every report query in parallel, keyed by name"""
+    # resolved here: worker threads have no script context
+    con, cache_dir = get_duckdb(), get_cache_dir()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = pool.map(lambda query: spill_query(con, cache_dir, query),
+                           queries.values())
+    return dict(zip(queries, results))
+
+@st.cache_data(ttl=3600)
+def query_csv(queries, name):
+    """CSV bytes of a prefetched report for the download button"""
+    return run_all_queries(queries)[name].to_csv(index=False).encode('utf-8')
+
+# ============================================================================
+# 🔽 FILTER OPTIONS (cached)
+# ============================================================================
+
+@st.cache_data(ttl=3600)
+def list_airlines():
+    """Distinct airline names for filter dropdowns"""
+    return get_data(
+        "SELECT DISTINCT airline_name FROM s.flights ORDER BY airline_name"
+    )["airline_name"].tolist()
+
+@st.cache_data(ttl=3600)
+def list_statuses():
+    """Distinct flight statuses for filter dropdowns"""
+    return get_data(
+        "SELECT DISTINCT status FROM s.flights ORDER BY status"
+    )["status"].tolist()
+
+@st.cache_data(ttl=3600)
+def list_airports():
+    """Distinct airport IATA codes for filter dropdowns"""
+    return get_data(
+        "SELECT DISTINCT iata_code FROM s.airports ORDER BY iata_code"
+    )["iata_code"].tolist()
+
+@st.cache_data(ttl=300)
+def get_summary_metrics():
+    """Home dashboard totals in a single round trip"""
+    return get_row("""
+        SELECT
+            (SELECT COUNT(*) FROM s.flights)                      AS flights,
+            (SELECT COUNT(*) FROM s.aircraft)                     AS aircraft,
+            (SELECT COUNT(*) FROM s.airports)                     AS airports,
+            (SELECT COUNT(DISTINCT airline_name) FROM s.flights)  AS airlines
+    """)
+
+# ============================================================================
+# 📈 CHARTS (cached figures, keyed on the input DataFrame)
+# ============================================================================
+
+@st.cache_data
+def build_status_pie(df):
+    """Home dashboard flight status pie"""
+    return px.pie(df, values='count', names='status', 
+                  title='Flight Status Breakdown',
+                  color_discrete_sequence=px.colors.qualitative.Set3)
+
+@st.cache_data
+def build_airline_bar(df):
+    """Home dashboard busiest airlines bar"""
+    return px.bar(df, x='airline_name', y='flight_count',
+                  title='Busiest Airlines',
+                  labels={'airline_name': 'Airline', 'flight_count': 'Flights'},
+                  color='flight_count',
+                  color_continuous_scale='Blues')
+
+@st.cache_data
+def build_aircraft_bar(df):
+    """Most used aircraft models bar"""
+    fig = px.bar(df, x='aircraft_model', y='flight_count',
+                 color='manufacturer',
+                 title='Most Used Aircraft Models',
+                 labels={'aircraft_model': 'Aircraft Model', 'flight_count': 'Number of Flights'},
+                 text='flight_count')
+    fig.update_traces(texttemplate='%{text}', textposition='outside')
+    return fig
+
+@st.cache_data
+def build_manufacturer_pie(df):
+    """Aircraft by manufacturer pie"""
+    return px.pie(df, values='aircraft_count', names='manufacturer',
+                  title='Aircraft by Manufacturer')
+
+@st.cache_data
+def build_delay_bar(df):
+    """Delay percentage by airport bar"""
+    return px.bar(df, x='iata_code', y='delay_percentage',
+                  title='Delay Percentage by Airport',
+                  labels={'iata_code': 'Airport', 'delay_percentage': 'Delay %'},
+                  hover_data=['airport_name', 'total_flights', 'avg_delay'])
 
 # ============================================================================
 # 🎨 CUSTOM CSS STYLING
@@ -965,15 +1173,12 @@ if page == "🏠 Home Dashboard":
     # Summary Statistics
     col1, col2, col3, col4 = st.columns(4)
     
-    total_flights = get_data("SELECT COUNT(*) as count FROM flights")['count'][0]
-    total_aircraft = get_data("SELECT COUNT(*) as count FROM aircraft")['count'][0]
-    total_airports = get_data("SELECT COUNT(*) as count FROM airports")['count'][0]
-    total_airlines = get_data("SELECT COUNT(DISTINCT airline_name) as count FROM flights")['count'][0]
+    summary = get_summary_metrics()
     
-    col1.metric("✈️ Total Flights", f"{total_flights:,}")
-    col2.metric("🛩️ Aircraft", f"{total_aircraft:,}")
-    col3.metric("🏢 Airports", f"{total_airports}")
-    col4.metric("🏢 Airlines", f"{total_airlines}")
+    col1.metric("✈️ Total Flights", f"{summary['flights']:,}")
+    col2.metric("🛩️ Aircraft", f"{summary['aircraft']:,}")
+    col3.metric("🏢 Airports", f"{summary['airports']}")
+    col4.metric("🏢 Airlines", f"{summary['airlines']}")
     
     st.markdown("---")
     
@@ -982,31 +1187,24 @@ if page == "🏠 Home Dashboard":
     
     with col1:
         st.subheader("📊 Flight Status Distribution")
-        status_data = get_data("""
-            SELECT status, COUNT(*) as count 
-            FROM flights 
-            GROUP BY status 
+        status_data = cached_query("""
+            SELECT status, count 
+            FROM s.mv_status_counts 
             ORDER BY count DESC
         """)
-        fig = px.pie(status_data, values='count', names='status', 
-                     title='Flight Status Breakdown',
-                     color_discrete_sequence=px.colors.qualitative.Set3)
+        fig = build_status_pie(status_data)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("🏢 Top 5 Airlines by Flight Count")
-        airline_data = get_data("""
+        airline_data = cached_query("""
             SELECT airline_name, COUNT(*) as flight_count 
-            FROM flights 
+            FROM s.flights 
             GROUP BY airline_name 
             ORDER BY flight_count DESC 
             LIMIT 5
         """)
-        fig = px.bar(airline_data, x='airline_name', y='flight_count',
-                     title='Busiest Airlines',
-                     labels={'airline_name': 'Airline', 'flight_count': 'Flights'},
-                     color='flight_count',
-                     color_continuous_scale='Blues')
+        fig = build_airline_bar(airline_data)
         st.plotly_chart(fig, use_container_width=True)
         
 # ============================================================================
@@ -1017,26 +1215,24 @@ elif page == "✈️ Flight Explorer":
     st.title("✈️ Flight Explorer")
     st.markdown("Search and filter flights with detailed information")
 
-    # Filters
-    col1, col2, col3 = st.columns(3)
+    # Filters (batched in a form: one rerun per Apply, not per selectbox)
+    with st.form("filters"):
+        col1, col2, col3 = st.columns(3)
 
-    with col1:
-        airlines = get_data(
-            "SELECT DISTINCT airline_name FROM flights ORDER BY airline_name"
-        )["airline_name"].tolist()
-        selected_airline = st.selectbox("Select Airline", ["All"] + airlines)
+        with col1:
+            airlines = list_airlines()
+            selected_airline = st.selectbox("Select Airline", ["All"] + airlines)
 
-    with col2:
-        statuses = get_data(
-            "SELECT DISTINCT status FROM flights ORDER BY status"
-        )["status"].tolist()
-        selected_status = st.selectbox("Select Status", ["All"] + statuses)
+        with col2:
+            statuses = list_statuses()
+            selected_status = st.selectbox("Select Status", ["All"] + statuses)
+
+        with col3:
+            airports = list_airports()
+            selected_origin = st.selectbox("Origin Airport", ["All"] + airports)
 
-    with col3:
-        airports = get_data(
-            "SELECT DISTINCT iata_code FROM airports ORDER BY iata_code"
-        )["iata_code"].tolist()
-        selected_origin = st.selectbox("Origin Airport", ["All"] + airports)
+        rows_to_show = st.slider("Rows to show", 50, 1000, 200, key="explorer_rows")
+        st.form_submit_button("Apply")
 
     # ------------------ BASE QUERY (for metrics: NO status filter) ------------------
     base_query = """
@@ -1047,8 +1243,8 @@ elif page == "✈️ Flight Explorer":
             origin.city      AS origin_city,
             f.scheduled_dep,
             f.status
-        FROM flights f
-        JOIN airports origin ON f.origin_icao = origin.icao_code
+        FROM s.flights f
+        JOIN s.airports origin ON f.origin_icao = origin.icao_code
         WHERE 1 = 1
     """
 
@@ -1060,8 +1256,14 @@ elif page == "✈️ Flight Explorer":
         base_query += " AND origin.iata_code = ?"
         base_params.append(selected_origin)
 
-    # full set for this airline/origin, all statuses
-    base_df = get_data(base_query, tuple(base_params) if base_params else None)
+    # counts over the full set for this airline/origin, all statuses
+    counts_query = f"""
+        SELECT
+            COUNT(*) AS total_flights,
+            COUNT(CASE WHEN status = 'Canceled' THEN 1 END) AS canceled_flights
+        FROM ({base_query}) AS base
+    """
+    counts = get_row(counts_query, tuple(base_params) if base_params else None)
 
     # ------------------ TABLE QUERY (optional extra status filter) ------------------
     table_query = base_query      # start from same query text
@@ -1074,14 +1276,27 @@ elif page == "✈️ Flight Explorer":
     table_query += " ORDER BY f.scheduled_dep DESC LIMIT 1000"
     flights_df = get_data(table_query, tuple(table_params) if table_params else None)
 
-    st.subheader(f"📋 Showing {len(flights_df)} flights")
-    st.dataframe(flights_df, use_container_width=True, height=400)
+    st.subheader(f"📋 Showing {min(rows_to_show, len(flights_df))} of {len(flights_df)} flights")
+    st.dataframe(
+        flights_df.head(rows_to_show),
+        use_container_width=True,
+        height=400,
+        column_config={
+            "flight_number": st.column_config.TextColumn("Flight", width="small"),
+            "airline_name": st.column_config.TextColumn("Airline", width="medium"),
+            "origin": st.column_config.TextColumn("Origin", width="small"),
+            "origin_city": st.column_config.TextColumn("Origin City", width="medium"),
+            "scheduled_dep": st.column_config.DatetimeColumn(
+                "Scheduled Departure", format="YYYY-MM-DD HH:mm", width="medium"),
+            "status": st.column_config.TextColumn("Status", width="small"),
+        },
+    )
 
-    # ------------------ CANCELLATION METRICS (always from base_df) ------------------
-    total_flights = len(base_df)
+    # ------------------ CANCELLATION METRICS (always from base counts) ------------------
+    total_flights = counts['total_flights']
 
-    if total_flights > 0 and "status" in base_df.columns:
-        canceled_count = (base_df["status"] == "Canceled").sum()
+    if total_flights > 0:
+        canceled_count = counts['canceled_flights']
         canceled_pct = (canceled_count / total_flights) * 100
 
         m1, m2, m3 = st.columns(3)
@@ -1105,25 +1320,20 @@ elif page == "🛩️ Aircraft Analytics":
     
     # Top Aircraft Models
     st.subheader("📊 Top 10 Aircraft Models by Flight Count")
-    aircraft_stats = get_data("""
+    aircraft_stats = cached_query("""
         SELECT 
             a.aircraft_model,
             a.manufacturer,
             COUNT(f.flight_id) as flight_count,
             COUNT(DISTINCT f.airline_name) as airlines_using
-        FROM aircraft a
-        JOIN flights f ON a.aircraft_reg = f.aircraft_reg
+        FROM s.aircraft a
+        JOIN s.flights f ON a.aircraft_reg = f.aircraft_reg
         GROUP BY a.aircraft_model, a.manufacturer
         ORDER BY flight_count DESC
         LIMIT 10
     """)
     
-    fig = px.bar(aircraft_stats, x='aircraft_model', y='flight_count',
-                 color='manufacturer',
-                 title='Most Used Aircraft Models',
-                 labels={'aircraft_model': 'Aircraft Model', 'flight_count': 'Number of Flights'},
-                 text='flight_count')
-    fig.update_traces(texttemplate='%{text}', textposition='outside')
+    fig = build_aircraft_bar(aircraft_stats)
     st.plotly_chart(fig, use_container_width=True)
     
     # Detailed Table
@@ -1132,15 +1342,14 @@ elif page == "🛩️ Aircraft Analytics":
     
     # Manufacturer Distribution
     st.subheader("🏭 Manufacturer Distribution")
-    mfr_data = get_data("""
+    mfr_data = cached_query("""
         SELECT manufacturer, COUNT(*) as aircraft_count
-        FROM aircraft
+        FROM s.aircraft
         GROUP BY manufacturer
         ORDER BY aircraft_count DESC
     """)
     
-    fig = px.pie(mfr_data, values='aircraft_count', names='manufacturer',
-                 title='Aircraft by Manufacturer')
+    fig = build_manufacturer_pie(mfr_data)
     st.plotly_chart(fig, use_container_width=True)
 
 # ============================================================================
@@ -1151,31 +1360,33 @@ elif page == "🏢 Airport Location":
     st.title("🏢 Airport Location")
     
     # Airport selector
-    airports = get_data("SELECT iata_code, name, city FROM airports ORDER BY name")
+    airports = cached_query("SELECT iata_code, name, city FROM s.airports ORDER BY name")
+    iata_to_name = dict(zip(airports['iata_code'], airports['name']))
     selected_airport = st.selectbox(
         "Select Airport",
         airports['iata_code'].tolist(),
-        format_func=lambda x: f"{x} - {airports[airports['iata_code']==x]['name'].values[0]}"
+        format_func=lambda x: f"{x} - {iata_to_name[x]}"
     )
     
     # Airport Details
     airport_info = get_data(
-        "SELECT * FROM airports WHERE iata_code = ?",
+        "SELECT * FROM s.airports WHERE iata_code = ?",
         (selected_airport,)
     )
     
     if not airport_info.empty:
-        st.subheader(f"📍 {airport_info['name'].values[0]}")
+        row = airport_info.iloc[0]
+        st.subheader(f"📍 {row['name']}")
         col1, col2, col3 = st.columns(3)
-        col1.metric("City", airport_info['city'].values[0])
-        col2.metric("Country", airport_info['country'].values[0])
-        col3.metric("Timezone", airport_info['timezone'].values[0])
+        col1.metric("City", row['city'])
+        col2.metric("Country", row['country'])
+        col3.metric("Timezone", row['timezone'])
         
         # Map
         st.subheader("🗺️ Location")
         map_data = pd.DataFrame({
-            'lat': [airport_info['latitude'].values[0]],
-            'lon': [airport_info['longitude'].values[0]]
+            'lat': [row['latitude']],
+            'lon': [row['longitude']]
         })
         st.map(map_data, zoom=10)
  
@@ -1189,42 +1400,40 @@ elif page == "⏰ Delay Insights":
     # Delay Statistics
     st.subheader("📊 Delay Overview")
     
-    delay_stats = get_data("""
+    # One scan: per-airport groups plus the grand total over all flights
+    delay_rows = cached_query("""
         SELECT 
-            COUNT(*) as total_flights,
-            SUM(CASE WHEN delay_dep > 0 THEN 1 ELSE 0 END) as delayed_flights,
-            ROUND(AVG(CASE WHEN delay_dep > 0 THEN delay_dep END), 2) as avg_delay,
-            MAX(delay_dep) as max_delay
-        FROM flights
+            ap.name AS airport_name,
+            ap.iata_code,
+            COUNT(f.flight_id) as total_flights,
+            COUNT(*) FILTER (WHERE f.delay_dep > 0) as delayed_flights,
+            ROUND(AVG(f.delay_dep) FILTER (WHERE f.delay_dep > 0), 2) as avg_delay,
+            ROUND((COUNT(*) FILTER (WHERE f.delay_dep > 0) * 100.0) / COUNT(f.flight_id), 2) as delay_percentage,
+            MAX(f.delay_dep) as max_delay,
+            GROUPING(ap.name) as is_total
+        FROM s.flights f
+        LEFT JOIN s.airports ap ON ap.icao_code = f.origin_icao
+        GROUP BY GROUPING SETS ((ap.name, ap.iata_code), ())
+        HAVING GROUPING(ap.name) = 1
+            OR (ap.name IS NOT NULL AND total_flights > 10)
+        ORDER BY delay_percentage DESC
     """)
+    is_total = delay_rows['is_total'] == 1
+    delay_stats = delay_rows[is_total].iloc[0]
+    airport_delays = (delay_rows[~is_total]
+                      .drop(columns=['max_delay', 'is_total'])
+                      .reset_index(drop=True))
     
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Total Flights", f"{delay_stats['total_flights'].values[0]:,}")
-    col2.metric("Delayed Flights", f"{delay_stats['delayed_flights'].values[0]:,}")
-    col3.metric("Avg Delay (min)", f"{delay_stats['avg_delay'].values[0]:.1f}")
-    col4.metric("Max Delay (min)", f"{delay_stats['max_delay'].values[0]:.0f}")
+    col1.metric("Total Flights", f"{int(delay_stats['total_flights']):,}")
+    col2.metric("Delayed Flights", f"{int(delay_stats['delayed_flights']):,}")
+    col3.metric("Avg Delay (min)", f"{delay_stats['avg_delay']:.1f}")
+    col4.metric("Max Delay (min)", f"{delay_stats['max_delay']:.0f}")
     
     # Delay by Airport
     st.subheader("🏢 Delays by Airport")
-    airport_delays = get_data("""
-        SELECT 
-            ap.name AS airport_name,
-            ap.iata_code,
-            COUNT(f.flight_id) as total_flights,
-            SUM(CASE WHEN f.delay_dep > 0 THEN 1 ELSE 0 END) as delayed_flights,
-            ROUND(AVG(CASE WHEN f.delay_dep > 0 THEN f.delay_dep END), 2) as avg_delay,
-            ROUND((SUM(CASE WHEN f.delay_dep > 0 THEN 1 ELSE 0 END) * 100.0) / COUNT(f.flight_id), 2) as delay_percentage
-        FROM airports ap
-        JOIN flights f ON ap.icao_code = f.origin_icao
-        GROUP BY ap.name, ap.iata_code
-        HAVING total_flights > 10
-        ORDER BY delay_percentage DESC
-    """)
     
-    fig = px.bar(airport_delays, x='iata_code', y='delay_percentage',
-                 title='Delay Percentage by Airport',
-                 labels={'iata_code': 'Airport', 'delay_percentage': 'Delay %'},
-                 hover_data=['airport_name', 'total_flights', 'avg_delay'])
+    fig = build_delay_bar(airport_delays)
     st.plotly_chart(fig, use_container_width=True)
     
     # Detailed Table
@@ -1241,12 +1450,7 @@ elif page == "📊 SQL Query Results":
     
     query_options = {
                 "1) Flights per Aircraft Model": """
-            SELECT 
-                a.aircraft_model,
-                COUNT(f.flight_id) AS total_flights
-            FROM flights f
-            JOIN aircraft a ON f.aircraft_reg = a.aircraft_reg
-            GROUP BY a.aircraft_model
+            SELECT * FROM s.mv_flights_per_model
             ORDER BY total_flights DESC
         """,
         "2) Aircraft with > 5 Flights": """
@@ -1255,8 +1459,8 @@ elif page == "📊 SQL Query Results":
                 a.aircraft_model AS model,
                 a.manufacturer,
                 COUNT(f.flight_id) AS flight_count
-            FROM aircraft a
-            JOIN flights f ON a.aircraft_reg = f.aircraft_reg
+            FROM s.aircraft a
+            JOIN s.flights f ON a.aircraft_reg = f.aircraft_reg
             GROUP BY a.aircraft_reg, a.aircraft_model, a.manufacturer
             HAVING COUNT(f.flight_id) > 5
             ORDER BY flight_count DESC
@@ -1267,8 +1471,8 @@ elif page == "📊 SQL Query Results":
                 ap.city,
                 ap.country,
                 COUNT(f.flight_id) AS outbound_flights
-            FROM airports ap
-            JOIN flights f ON ap.icao_code = f.origin_icao
+            FROM s.airports ap
+            JOIN s.flights f ON ap.icao_code = f.origin_icao
             GROUP BY ap.icao_code, ap.name, ap.city, ap.country
             HAVING COUNT(f.flight_id) > 5
             ORDER BY outbound_flights DESC
@@ -1279,13 +1483,15 @@ elif page == "📊 SQL Query Results":
                 ap.city,
                 ap.country,
                 COUNT(f.flight_id) AS arriving_flights
-            FROM airports ap
-            JOIN flights f ON ap.icao_code = f.dest_icao
+            FROM s.airports ap
+            JOIN s.flights f ON ap.icao_code = f.dest_icao
             GROUP BY ap.icao_code, ap.name, ap.city, ap.country
             ORDER BY arriving_flights DESC
             LIMIT 3
         """,
         "5) Domestic vs International (Per Flight)": """
+            -- known origin (inner join), then known destination with an
+            -- unknown origin, so each flight appears once
             SELECT 
                 f.flight_number,
                 origin.iata_code AS origin,
@@ -1296,11 +1502,24 @@ elif page == "📊 SQL Query Results":
                     WHEN origin.country = dest.country THEN 'Domestic'
                     ELSE 'International'
                 END AS flight_type
-            FROM flights f
-            LEFT JOIN airports origin ON f.origin_icao = origin.icao_code
-            LEFT JOIN airports dest   ON f.dest_icao   = dest.icao_code
-            WHERE origin.icao_code IS NOT NULL
-               OR dest.icao_code   IS NOT NULL
+            FROM s.flights f
+            JOIN s.airports origin    ON f.origin_icao = origin.icao_code
+            LEFT JOIN s.airports dest ON f.dest_icao   = dest.icao_code
+            UNION ALL
+            SELECT 
+                f.flight_number,
+                origin.iata_code AS origin,
+                origin.country   AS origin_country,
+                dest.iata_code   AS destination,
+                dest.country     AS dest_country,
+                CASE 
+                    WHEN origin.country = dest.country THEN 'Domestic'
+                    ELSE 'International'
+                END AS flight_type
+            FROM s.flights f
+            JOIN s.airports dest        ON f.dest_icao   = dest.icao_code
+            LEFT JOIN s.airports origin ON f.origin_icao = origin.icao_code
+            WHERE origin.icao_code IS NULL
             LIMIT 200
         """,
         "6) 5 Most Recent Arrivals at DEL": """
@@ -1312,10 +1531,10 @@ elif page == "📊 SQL Query Results":
                 origin.city AS departure_city,
                 f.actual_arr AS arrival_time,
                 f.status
-            FROM flights f
-            LEFT JOIN aircraft a ON f.aircraft_reg = a.aircraft_reg
-            LEFT JOIN airports origin ON f.origin_icao = origin.icao_code
-            LEFT JOIN airports dest   ON f.dest_icao   = dest.icao_code
+            FROM s.flights f
+            LEFT JOIN s.aircraft a ON f.aircraft_reg = a.aircraft_reg
+            LEFT JOIN s.airports origin ON f.origin_icao = origin.icao_code
+            LEFT JOIN s.airports dest   ON f.dest_icao   = dest.icao_code
             WHERE dest.iata_code = 'DEL'
             ORDER BY f.scheduled_arr DESC
             LIMIT 5
@@ -1326,24 +1545,13 @@ elif page == "📊 SQL Query Results":
                 ap.name   AS airport_name,
                 ap.city,
                 ap.country
-            FROM airports ap
-            LEFT JOIN flights f ON ap.icao_code = f.dest_icao
+            FROM s.airports ap
+            LEFT JOIN s.flights f ON ap.icao_code = f.dest_icao
             WHERE f.flight_id IS NULL
             ORDER BY ap.name
         """,
         "8) Flights by Status per Airline": """
-            SELECT 
-                f.airline_name,
-                SUM(CASE WHEN f.status = 'Arrived'     THEN 1 ELSE 0 END) AS arrived,
-                SUM(CASE WHEN f.status = 'Departed'    THEN 1 ELSE 0 END) AS departed,
-                SUM(CASE WHEN f.status = 'Unknown'     THEN 1 ELSE 0 END) AS unknown,
-                SUM(CASE WHEN f.status = 'Expected'    THEN 1 ELSE 0 END) AS expected,
-                SUM(CASE WHEN f.status = 'Approaching' THEN 1 ELSE 0 END) AS approaching,
-                SUM(CASE WHEN f.status = 'Canceled'    THEN 1 ELSE 0 END) AS canceled,
-                SUM(CASE WHEN f.status = 'Delayed'     THEN 1 ELSE 0 END) AS delayed,
-                COUNT(f.flight_id) AS total_flights
-            FROM flights f
-            GROUP BY f.airline_name
+            SELECT * FROM s.mv_status_by_airline
             ORDER BY total_flights DESC
         """,
         "9) All Cancelled Flights": """
@@ -1354,67 +1562,75 @@ elif page == "📊 SQL Query Results":
                 dest.city AS destination_city,
                 f.scheduled_dep AS scheduled_departure,
                 f.status
-            FROM flights f
-            LEFT JOIN aircraft a ON f.aircraft_reg = a.aircraft_reg
-            LEFT JOIN airports origin ON f.origin_icao = origin.icao_code
-            LEFT JOIN airports dest   ON f.dest_icao   = dest.icao_code
+            FROM s.flights f
+            LEFT JOIN s.aircraft a ON f.aircraft_reg = a.aircraft_reg
+            LEFT JOIN s.airports origin ON f.origin_icao = origin.icao_code
+            LEFT JOIN s.airports dest   ON f.dest_icao   = dest.icao_code
             WHERE f.status = 'Canceled'
-            ORDER BY f.scheduled_dep DESC NULLS LAST
+            ORDER BY f.scheduled_dep DESC  -- NULLs sort last under DESC
         """,
         "10) City Pairs with > 2 Aircraft Models": """
+            WITH pairs AS (
+                -- one row per (city pair, model): the DISTINCT is done once here
+                SELECT 
+                    origin.city      AS origin_city,
+                    dest.city        AS dest_city,
+                    origin.iata_code AS origin_code,
+                    dest.iata_code   AS dest_code,
+                    a.aircraft_model
+                FROM s.flights f
+                LEFT JOIN s.airports origin ON f.origin_icao = origin.icao_code
+                LEFT JOIN s.airports dest   ON f.dest_icao   = dest.icao_code
+                LEFT JOIN s.aircraft a      ON f.aircraft_reg = a.aircraft_reg
+                GROUP BY origin.city, dest.city, origin.iata_code, dest.iata_code,
+                         a.aircraft_model
+            )
             SELECT 
-                origin.city AS origin_city,
-                dest.city   AS dest_city,
-                origin.iata_code AS origin_code,
-                dest.iata_code   AS dest_code,
-                COUNT(DISTINCT a.aircraft_model) AS aircraft_model_count,
-                GROUP_CONCAT(DISTINCT a.aircraft_model) AS aircraft_models
-            FROM flights f
-            LEFT JOIN airports origin ON f.origin_icao = origin.icao_code
-            LEFT JOIN airports dest   ON f.dest_icao   = dest.icao_code
-            LEFT JOIN aircraft a      ON f.aircraft_reg = a.aircraft_reg
-            GROUP BY origin.city, dest.city, origin.iata_code, dest.iata_code
-            HAVING COUNT(DISTINCT a.aircraft_model) > 2
+                origin_city,
+                dest_city,
+                origin_code,
+                dest_code,
+                COUNT(aircraft_model) AS aircraft_model_count,
+                GROUP_CONCAT(aircraft_model) AS aircraft_models
+            FROM pairs
+            GROUP BY origin_city, dest_city, origin_code, dest_code
+            HAVING COUNT(aircraft_model) > 2
             ORDER BY aircraft_model_count DESC
             LIMIT 20
         """,
         "11) % Delayed Arrivals per Destination": """
-            SELECT 
-                ap.name AS airport_name,
-                ap.city,
-                ap.iata_code,
-                COUNT(f.flight_id) AS total_arrivals,
-                SUM(CASE WHEN f.status = 'Delayed' OR f.delay_arr > 0 THEN 1 ELSE 0 END)
-                    AS delayed_arrivals,
-                ROUND(
-                    (SUM(CASE WHEN f.status = 'Delayed' OR f.delay_arr > 0 THEN 1 ELSE 0 END)
-                    * 100.0) / COUNT(f.flight_id),
-                    2
-                ) AS delay_percentage
-            FROM airports ap
-            JOIN flights f ON ap.icao_code = f.dest_icao
-            GROUP BY ap.icao_code, ap.name, ap.city, ap.iata_code
-            HAVING COUNT(f.flight_id) > 0
+            SELECT * FROM s.mv_delays_by_dest
             ORDER BY delay_percentage DESC
         """,
     }
     
     selected_query = st.selectbox("Select Query", list(query_options.keys()))
+    rows_to_show = st.slider("Rows to show", 50, 2000, 200, key="query_rows")
     
-    if st.button("Execute Query"):
-        with st.spinner("Executing query..."):
-            result = get_data(query_options[selected_query])
-            st.success(f"Query returned {len(result)} rows")
-            st.dataframe(result, use_container_width=True)
-            
-            # Download option
-            csv = result.to_csv(index=False)
-            st.download_button(
-                label="📥 Download as CSV",
-                data=csv,
-                file_name=f"{selected_query.replace(' ', '_')}.csv",
-                mime="text/csv"
-            )
+    # All 11 results are fetched once, so switching queries is instant
+    with st.spinner("Executing queries..."):
+        results = run_all_queries(query_options)
+    
+    result = results[selected_query]
+    st.success(f"Query returned {len(result)} rows")
+    # Report columns vary per query: keep the numeric ones narrow
+    st.dataframe(
+        result.head(rows_to_show),
+        use_container_width=True,
+        column_config={
+            col: st.column_config.NumberColumn(width="small")
+            for col in result.select_dtypes('number').columns
+        },
+    )
+    
+    # Download option (full result, encoded once per query)
+    csv = query_csv(query_options, selected_query)
+    st.download_button(
+        label="📥 Download as CSV",
+        data=csv,
+        file_name=f"{selected_query.replace(' ', '_')}.csv",
+        mime="text/csv"
+    )
 
 # ============================================================================
 # 👨‍💻 PAGE 7: ABOUT PROJECT